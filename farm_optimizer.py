@@ -1,50 +1,59 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import List, Dict, Optional
-from enum import Enum
+from typing import List, Dict, FrozenSet, Optional, Tuple
+from enum import Enum, IntEnum
+from operator import attrgetter
 import math
 
+import numpy as np
+from numba import njit
+
 
 class PowerTimeOfUse(Enum):
     DAYTIME_ONLY = "daytime_only"
     NIGHT_ONLY = "night_only"
     ANY_TIME = "any_time"
 
-# class Season(Enum):
-#     SPRING = "spring"
-#     SUMMER = "summer"
-#     FALL = "fall"
-#     WINTER = "winter"
-
-class Season(Enum):
-    SPRING = "spring"
-    SUMMER = "summer"
-    FALL = "fall"
-    WINTER = "winter"
+class Season(IntEnum):
+    # Values index the per-season tuples (seasonal_multipliers, seasonal_benefits)
+    SPRING = 0
+    SUMMER = 1
+    FALL = 2
+    WINTER = 3
 
     @classmethod
     def from_month(cls, month: int) -> 'Season':
         # Convert month number (0-23) to season enum
-        season_map = {
-            0: cls.SPRING,  # March
-            1: cls.SUMMER,  # June
-            2: cls.FALL,    # September
-            3: cls.WINTER   # December
-        }
-        return season_map[month % 4]
+        return _SEASONS[month & 3]
+
+# Season for each month % 4: March, June, September, December
+_SEASONS = (Season.SPRING, Season.SUMMER, Season.FALL, Season.WINTER)
+
+
+def _per_season(values) -> Tuple[float, float, float, float]:
+    """Per-Season tuple from a sequence, or from the older {Season: value} mapping"""
+    if isinstance(values, Mapping):
+        return tuple(values[season] for season in Season)
+    return tuple(values)
+
 
-@dataclass
+@dataclass(slots=True)
 class PowerUsage:
     kwh_daily: float
     time_of_use: PowerTimeOfUse
 
-@dataclass
+@dataclass(slots=True)
 class MarketConnection:
     name: str
-    product_types: List[str]  # e.g., ["plants", "eggs", "meat"]
+    product_types: FrozenSet[str]  # e.g., frozenset({"plants", "eggs", "meat"})
     sales_multiplier: float  # How much this connection improves sales probability
 
+    def __post_init__(self):
+        # Accept any iterable of product types; membership checks hash instead of scanning
+        self.product_types = frozenset(self.product_types)
+
 
-@dataclass
+@dataclass(slots=True)
 class Resources:
     solar_power_kw: float
     battery_capacity_kwh: float
@@ -64,20 +73,22 @@ class Resources:
     target_savings: float = 25000  # Target amount for well
 
 
-@dataclass
+@dataclass(slots=True)
 class InfrastructureUpgrade:
     name: str
     cost: float
     resource_impacts: Dict[str, float]
     monthly_operating_cost: float = 0
-    seasonal_benefits: Dict[Season, float] = None  # Multiplier for revenue in each season
+    seasonal_benefits: Tuple[float, float, float, float] = None  # Revenue multiplier per Season
 
     def __post_init__(self):
         if self.seasonal_benefits is None:
-            self.seasonal_benefits = {season: 1.0 for season in Season}
+            self.seasonal_benefits = (1.0,) * len(Season)
+        else:
+            self.seasonal_benefits = _per_season(self.seasonal_benefits)
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     name: str
     setup_cost: float
@@ -89,7 +100,7 @@ class Project:
     daily_hours: float
     water_gallons_daily: float
     power_usage: PowerUsage
-    startup_time_months: float
+    startup_time_months: int  # Time to reach production stage
     knowledge_required: int
     sustainability_score: int
     synergy_projects: List[str]
@@ -97,11 +108,13 @@ class Project:
     automation_potential: int
     product_type: str  # e.g., "plants", "eggs", "meat"
     base_sales_probability: float  # Base probability of selling produced goods
-    seasonal_multipliers: Dict[Season, float]  # How season affects production/sales
+    seasonal_multipliers: Tuple[float, float, float, float]  # How each Season affects production/sales
     climate_controlled_benefit: float  # Revenue multiplier if in climate-controlled space
-    startup_time_months: int  # Time to reach production stage
     current_stage: str = "setup"  # Initial stage
-    monthly_revenue: float = 0  # Placeholder value
+    funded_so_far: float = 0  # Setup funds allocated so far
+
+    def __post_init__(self):
+        self.seasonal_multipliers = _per_season(self.seasonal_multipliers)
 
     def update_stage(self):
         if self.current_stage == "setup" and self.startup_time_months == 0:
@@ -109,61 +122,58 @@ class Project:
         elif self.current_stage == "setup":
             self.startup_time_months -= 1
 
-class FarmOptimizer:
-    def __init__(self, resources: Resources):
-        self.resources = resources
-        self.projects = self._initialize_projects()
-        self.infrastructure_upgrades = self._initialize_upgrades()
 
-    def _initialize_upgrades(self) -> Dict[str, InfrastructureUpgrade]:
-        return {
-            "well": InfrastructureUpgrade(
-                name="Water Well Installation",
-                cost=25000,
-                resource_impacts={"water_cost": -1.0},  # Eliminates water transport cost
-                monthly_operating_cost=50,  # Electricity for pump, maintenance
-                seasonal_benefits={season: 1.0 for season in Season}
-            ),
-            "greenhouse": InfrastructureUpgrade(
-                name="Greenhouse Construction",
-                cost=5000,
-                resource_impacts={
-                    "climate_controlled_sqft": 500,
-                    "indoor_space_sqft": 500
-                },
-                monthly_operating_cost=100,  # Climate control costs
-                seasonal_benefits={
-                    Season.SPRING: 1.2,
-                    Season.SUMMER: 1.0,
-                    Season.FALL: 1.3,
-                    Season.WINTER: 1.5  # Biggest benefit in winter
-                }
-            ),
-            "hoop_house": InfrastructureUpgrade(
-                name="Hoop House",
-                cost=2000,
-                resource_impacts={
-                    "indoor_space_sqft": 300
-                },
-                monthly_operating_cost=30,
-                seasonal_benefits={
-                    Season.SPRING: 1.3,
-                    Season.SUMMER: 1.1,
-                    Season.FALL: 1.2,
-                    Season.WINTER: 1.2
-                }
+# Project and upgrade data is built fresh for each optimizer: constructing the
+# dataclasses is cheaper than copying shared templates, and nothing is shared
+def _default_upgrades() -> Dict[str, InfrastructureUpgrade]:
+    return {
+        "well": InfrastructureUpgrade(
+            name="Water Well Installation",
+            cost=25000,
+            resource_impacts={"water_cost": -1.0},  # Eliminates water transport cost
+            monthly_operating_cost=50,  # Electricity for pump, maintenance
+            seasonal_benefits=(1.0,) * len(Season)
+        ),
+        "greenhouse": InfrastructureUpgrade(
+            name="Greenhouse Construction",
+            cost=5000,
+            resource_impacts={
+                "climate_controlled_sqft": 500,
+                "indoor_space_sqft": 500
+            },
+            monthly_operating_cost=100,  # Climate control costs
+            seasonal_benefits=(
+                1.2,  # Spring
+                1.0,  # Summer
+                1.3,  # Fall
+                1.5   # Winter, biggest benefit
             )
-        }
+        ),
+        "hoop_house": InfrastructureUpgrade(
+            name="Hoop House",
+            cost=2000,
+            resource_impacts={
+                "indoor_space_sqft": 300
+            },
+            monthly_operating_cost=30,
+            seasonal_benefits=(
+                1.3,  # Spring
+                1.1,  # Summer
+                1.2,  # Fall
+                1.2   # Winter
+            )
+        )
+    }
 
-    def _initialize_projects(self) -> Dict[str, Project]:
-        projects = {}
 
+def _default_projects() -> Dict[str, Project]:
+    return {
         # Existing project
-        projects["air_plants"] = Project(
+        "air_plants": Project(
             name="Air Cleaning Plants",
             setup_cost=200,
             monthly_cost=30,
-            monthly_revenue=100,
+            monthly_revenue=100,  # Expected once in production, like the other projects
             space_required_sqft=50,
             is_indoor=True,
             daily_hours=0.5,
@@ -177,21 +187,19 @@ class FarmOptimizer:
             automation_potential=7,
             product_type="plants",
             base_sales_probability=0.7,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.1,
-                Season.WINTER: 1.3
-            },
+            seasonal_multipliers=(
+                1.2,  # Spring
+                1.0,  # Summer
+                1.1,  # Fall
+                1.3   # Winter
+            ),
             climate_controlled_benefit=1.2,
-            startup_time_months= 3,  # Time to reach production stage
             current_stage = "setup",  # Initial stage
-            monthly_revenue= 0,  # Placeholder value
             monthly_savings=0,
-        )
+        ),
 
         # New projects
-        projects["rabbit_breeding"] = Project(
+        "rabbit_breeding": Project(
             name="Rabbit Breeding",
             setup_cost=500,
             monthly_cost=50,
@@ -208,18 +216,18 @@ class FarmOptimizer:
             automation_potential=5,
             product_type="meat",
             base_sales_probability=0.8,
-            seasonal_multipliers={
-                Season.SPRING: 1.1,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.2,
-                Season.WINTER: 1.0
-            },
+            seasonal_multipliers=(
+                1.1,  # Spring
+                1.0,  # Summer
+                1.2,  # Fall
+                1.0   # Winter
+            ),
             climate_controlled_benefit=1.1,
             monthly_revenue=100,
             monthly_savings=0,
-        )
+        ),
 
-        projects["duck_ranching"] = Project(
+        "duck_ranching": Project(
             name="Duck Ranching",
             setup_cost=1000,
             monthly_cost=100,
@@ -236,18 +244,18 @@ class FarmOptimizer:
             automation_potential=4,
             product_type="eggs, meat",
             base_sales_probability=0.9,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.1,
-                Season.FALL: 1.0,
-                Season.WINTER: 0.8
-            },
+            seasonal_multipliers=(
+                1.2,  # Spring
+                1.1,  # Summer
+                1.0,  # Fall
+                0.8   # Winter
+            ),
             climate_controlled_benefit=1.0,
             monthly_revenue=100,
             monthly_savings=20,
-        )
+        ),
 
-        projects["black_soldier_fly_larvae"] = Project(
+        "black_soldier_fly_larvae": Project(
             name="Black Soldier Fly Larvae",
             setup_cost=200,
             monthly_cost=20,
@@ -264,18 +272,18 @@ class FarmOptimizer:
             automation_potential=6,
             product_type="feed",
             base_sales_probability=0.9,
-            seasonal_multipliers={
-                Season.SPRING: 1.1,
-                Season.SUMMER: 1.2,
-                Season.FALL: 1.0,
-                Season.WINTER: 0.9
-            },
+            seasonal_multipliers=(
+                1.1,  # Spring
+                1.2,  # Summer
+                1.0,  # Fall
+                0.9   # Winter
+            ),
             climate_controlled_benefit=1.0,
             monthly_revenue=100,
             monthly_savings=20,
-        )
+        ),
 
-        projects["edible_insects"] = Project(
+        "edible_insects": Project(
             name="Edible Insects",
             setup_cost=300,
             monthly_cost=30,
@@ -292,18 +300,18 @@ class FarmOptimizer:
             automation_potential=5,
             product_type="food",
             base_sales_probability=0.8,
-            seasonal_multipliers={
-                Season.SPRING: 1.1,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.2,
-                Season.WINTER: 1.0
-            },
+            seasonal_multipliers=(
+                1.1,  # Spring
+                1.0,  # Summer
+                1.2,  # Fall
+                1.0   # Winter
+            ),
             climate_controlled_benefit=1.1,
             monthly_revenue=100,
             monthly_savings=20,
-        )
+        ),
 
-        projects["geese_ranching"] = Project(
+        "geese_ranching": Project(
             name="Geese Ranching",
             setup_cost=800,
             monthly_cost=80,
@@ -320,19 +328,18 @@ class FarmOptimizer:
             automation_potential=4,
             product_type="eggs, meat",
             base_sales_probability=0.85,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.1,
-                Season.FALL: 1.0,
-                Season.WINTER: 0.8
-            },
+            seasonal_multipliers=(
+                1.2,  # Spring
+                1.1,  # Summer
+                1.0,  # Fall
+                0.8   # Winter
+            ),
             climate_controlled_benefit=1.0,
             monthly_revenue=100,
             monthly_savings=20,
-        )
+        ),
 
-
-        projects["ornamental plants"] = Project(
+        "ornamental plants": Project(
             name="Plant Cloning",
             setup_cost=300,
             monthly_cost=20,
@@ -351,16 +358,16 @@ class FarmOptimizer:
             automation_potential=5,
             product_type="plants",
             base_sales_probability=0.8,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.1,
-                Season.WINTER: 1.0
-            },
+            seasonal_multipliers=(
+                1.2,  # Spring
+                1.0,  # Summer
+                1.1,  # Fall
+                1.0   # Winter
+            ),
             climate_controlled_benefit=1.2,
-        )
+        ),
 
-        projects["plant_cloning"] = Project(
+        "plant_cloning": Project(
             name="Plant Cloning",
             setup_cost=300,
             monthly_cost=20,
@@ -379,257 +386,409 @@ class FarmOptimizer:
             automation_potential=5,
             product_type="plants",
             base_sales_probability=0.8,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.1,
-                Season.WINTER: 1.0
-            },
-            climate_controlled_benefit=1.2,
-        )
+            seasonal_multipliers=(
+                1.2,  # Spring
+                1.0,  # Summer
+                1.1,  # Fall
+                1.0   # Winter
+            ),
+            climate_controlled_benefit=1.2
+        ),
+    }
+
+
+# Integer codes for Project.current_stage used by the compiled projection loop
+_STAGE_SETUP, _STAGE_GROWTH, _STAGE_PRODUCTION = 0, 1, 2
+_STAGES = ("setup", "growth", "production")
+
+
+@njit(cache=True)
+def _season_counts(months):
+    """Number of months that fall in each season over months starting in spring"""
+    counts = np.full(4, months // 4, dtype=np.float64)
+    counts[:months & 3] += 1
+    return counts
+
+
+@njit(cache=True)
+def _climate_revenue(rev_plain, rev_climate, space_required, climate_sqft):
+    """Revenue table with the climate benefit applied to projects that fit in climate_sqft"""
+    table = rev_plain.copy()
+    for p in range(table.shape[0]):
+        if space_required[p] <= climate_sqft:
+            table[p] = rev_climate[p]
+    return table
+
+
+@njit(cache=True)
+def _seasonal_revenue(rev_table, mask):
+    """Per-season revenue summed over the projects selected by mask"""
+    total = np.zeros(4)
+    for p in range(rev_table.shape[0]):
+        if mask[p]:
+            total += rev_table[p]
+    return total
+
+
+@njit(cache=True, fastmath=True)
+def _project_numba(active, stage, startup_left, funded_so_far, setup_costs, monthly_costs,
+                   water_costs, is_indoor, space_required, rev_plain, rev_climate, climate_sqft,
+                   upgrade_costs, upgrade_op_costs, upgrade_gain, upgrade_climate,
+                   upgrade_climate_sqft, budget, reinvestment_rate, months):
+    """Numeric core of FarmOptimizer.optimize_with_infrastructure.
+
+    stage, startup_left and funded_so_far are updated in place. Returns the monthly
+    profits, accumulated savings and total infrastructure investment, the month each
+    upgrade was implemented (-1 if never) and a months x projects mask of funding.
+    """
+    num_projects = setup_costs.shape[0]
+    num_upgrades = upgrade_costs.shape[0]
+    profits = np.zeros(months)
+    savings = np.zeros(months)
+    invest = np.zeros(months)
+    upgrade_month = np.full(num_upgrades, -1, dtype=np.int64)
+    funded = np.zeros((months, num_projects), dtype=np.bool_)
+    rev_table = _climate_revenue(rev_plain, rev_climate, space_required, climate_sqft)
+    accumulated_savings = 0.0
+    invested = 0.0
+
+    # Running totals over the active projects. The active set is fixed for the
+    # projection, so costs never change; revenue only changes when a project enters
+    # production or a climate upgrade changes the revenue table.
+    monthly_costs_total = 0.0
+    for p in range(num_projects):
+        if active[p]:
+            monthly_costs_total += monthly_costs[p] + water_costs[p]
+    producing = active & (stage == _STAGE_PRODUCTION)
+    producing_revenue = _seasonal_revenue(rev_table, producing)
+    # Seasonal revenue of the indoor projects a climate upgrade would improve
+    indoor_revenue = _seasonal_revenue(rev_table, producing & is_indoor)
+
+    for month in range(months):
+        season = month & 3
+
+        # Update project stages; only projects in production earn revenue
+        for p in range(num_projects):
+            if active[p] and stage[p] == _STAGE_SETUP:
+                if startup_left[p] == 0:
+                    stage[p] = _STAGE_PRODUCTION
+                    producing[p] = True
+                    producing_revenue += rev_table[p]
+                    if is_indoor[p]:
+                        indoor_revenue += rev_table[p]
+                else:
+                    startup_left[p] -= 1
+
+        # Allocate funds to projects based on available budget and project stage
+        for p in range(num_projects):
+            if not active[p] and stage[p] == _STAGE_SETUP:
+                required_funds = setup_costs[p] - funded_so_far[p]
+                if required_funds <= budget:
+                    funded_so_far[p] += required_funds
+                    budget -= required_funds
+                    if funded_so_far[p] >= setup_costs[p]:
+                        stage[p] = _STAGE_GROWTH
+                    funded[month, p] = True
+
+        monthly_profit = producing_revenue[season] - monthly_costs_total
+        profits[month] = monthly_profit
+
+        # Select the affordable upgrade with the best ROI over the remaining months
+        reinvestment_amount = monthly_profit + budget
+        candidates = np.flatnonzero((upgrade_month < 0) & (upgrade_costs <= reinvestment_amount))
+        best = -1
+        if candidates.size > 0:
+            remaining = months - month
+            months_per_season = _season_counts(remaining)
+            total_benefit = (upgrade_gain * (months_per_season * indoor_revenue)).sum(axis=1)
+            total_benefit *= upgrade_climate
+            total_cost = upgrade_costs + upgrade_op_costs * remaining
+            # Divide by 1 for free upgrades so no NaN/Inf reaches this fastmath code
+            has_cost = total_cost > 0
+            roi = np.where(has_cost, (total_benefit - total_cost) / np.where(has_cost, total_cost, 1.0), 0.0)
+            best = candidates[np.argmax(roi[candidates])]
+
+        if best >= 0:
+            upgrade_month[best] = month
+            reinvestment_amount -= upgrade_costs[best]
+            invested += upgrade_costs[best]
+            if upgrade_climate[best]:
+                climate_sqft += upgrade_climate_sqft[best]
+                rev_table = _climate_revenue(rev_plain, rev_climate, space_required, climate_sqft)
+                producing_revenue = _seasonal_revenue(rev_table, producing)
+                indoor_revenue = _seasonal_revenue(rev_table, producing & is_indoor)
+
+        # Update savings and budget
+        accumulated_savings += reinvestment_amount * (1 - reinvestment_rate)
+        budget = reinvestment_amount * reinvestment_rate
+        savings[month] = accumulated_savings
+        invest[month] = invested
+
+    return profits, savings, invest, upgrade_month, funded
 
-        projects["plant_cloning"] = Project(
-            name="Plant Cloning",
-            setup_cost=300,
-            monthly_cost=20,
-            monthly_revenue=1000,
-            monthly_savings=20,
-            space_required_sqft=30,
-            is_indoor=True,
-            daily_hours=1,
-            water_gallons_daily=2,
-            power_usage=PowerUsage(0.4, PowerTimeOfUse.ANY_TIME),
-            startup_time_months=2,
-            knowledge_required=3,
-            sustainability_score=8,
-            synergy_projects=["air_plants", "microgreens"],
-            scalability=7,
-            automation_potential=5,
-            product_type="plants",
-            base_sales_probability=0.8,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.1,
-                Season.WINTER: 1.0
-            },
-            climate_controlled_benefit=1.2,
-        )
 
-        projects["plant_cloning"] = Project(
-            name="Plant Cloning",
-            setup_cost=300,
-            monthly_cost=20,
-            monthly_revenue=1000,
-            monthly_savings=20,
-            space_required_sqft=30,
-            is_indoor=True,
-            daily_hours=1,
-            water_gallons_daily=2,
-            power_usage=PowerUsage(0.4, PowerTimeOfUse.ANY_TIME),
-            startup_time_months=2,
-            knowledge_required=3,
-            sustainability_score=8,
-            synergy_projects=["air_plants", "microgreens"],
-            scalability=7,
-            automation_potential=5,
-            product_type="plants",
-            base_sales_probability=0.8,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.1,
-                Season.WINTER: 1.0
-            },
-            climate_controlled_benefit=1.2,
-        )
+class FarmOptimizer:
+    def __init__(self, resources: Resources):
+        self.resources = resources
+        self.projects = self._initialize_projects()
+        self.infrastructure_upgrades = self._initialize_upgrades()
+        self._project_index = {id(p): i for i, p in enumerate(self.projects.values())}
+        self._proj_arrays = self._build_project_arrays()
+        self._upgrade_arrays = self._build_upgrade_arrays()
+        # Resolve each upgrade's resource impacts to (getter, attribute, delta) once
+        self._upgrade_impact_ops = [
+            [(attrgetter(resource), resource, impact)
+             for resource, impact in upgrade.resource_impacts.items()
+             if hasattr(self.resources, resource)]
+            for upgrade in self.infrastructure_upgrades.values()
+        ]
+        self.refresh_resources()
 
-        projects["plant_cloning"] = Project(
-            name="Plant Cloning",
-            setup_cost=300,
-            monthly_cost=20,
-            monthly_revenue=1000,
-            monthly_savings=20,
-            space_required_sqft=30,
-            is_indoor=True,
-            daily_hours=1,
-            water_gallons_daily=2,
-            power_usage=PowerUsage(0.4, PowerTimeOfUse.ANY_TIME),
-            startup_time_months=2,
-            knowledge_required=3,
-            sustainability_score=8,
-            synergy_projects=["air_plants", "microgreens"],
-            scalability=7,
-            automation_potential=5,
-            product_type="plants",
-            base_sales_probability=0.8,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.1,
-                Season.WINTER: 1.0
-            },
-            climate_controlled_benefit=1.2
-        )
+    def _initialize_upgrades(self) -> Dict[str, InfrastructureUpgrade]:
+        return _default_upgrades()
 
+    def _initialize_projects(self) -> Dict[str, Project]:
+        return _default_projects()
 
-        projects["plant_cloning"] = Project(
-            name="Plant Cloning",
-            setup_cost=300,
-            monthly_cost=20,
-            monthly_revenue=1000,
-            monthly_savings=20,
-            space_required_sqft=30,
-            is_indoor=True,
-            daily_hours=1,
-            water_gallons_daily=2,
-            power_usage=PowerUsage(0.4, PowerTimeOfUse.ANY_TIME),
-            startup_time_months=2,
-            knowledge_required=3,
-            sustainability_score=8,
-            synergy_projects=["air_plants", "microgreens"],
-            scalability=7,
-            automation_potential=5,
-            product_type="plants",
-            base_sales_probability=0.8,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.1,
-                Season.WINTER: 1.0
-            },
-            climate_controlled_benefit=1.2
-        )
-        projects["plant_cloning"] = Project(
-            name="Plant Cloning",
-            setup_cost=300,
-            monthly_cost=20,
-            monthly_revenue=1000,
-            monthly_savings=20,
-            space_required_sqft=30,
-            is_indoor=True,
-            daily_hours=1,
-            water_gallons_daily=2,
-            power_usage=PowerUsage(0.4, PowerTimeOfUse.ANY_TIME),
-            startup_time_months=2,
-            knowledge_required=3,
-            sustainability_score=8,
-            synergy_projects=["air_plants", "microgreens"],
-            scalability=7,
-            automation_potential=5,
-            product_type="plants",
-            base_sales_probability=0.8,
-            seasonal_multipliers={
-                Season.SPRING: 1.2,
-                Season.SUMMER: 1.0,
-                Season.FALL: 1.1,
-                Season.WINTER: 1.0
-            },
-            climate_controlled_benefit=1.2
-        )
+    def _build_project_arrays(self) -> Dict[str, np.ndarray]:
+        """Struct-of-arrays copy of the project numbers used by the projection loop and scoring"""
+        projects = list(self.projects.values())
 
-        return projects
+        def column(attr, dtype=np.float64):
+            return np.fromiter((getattr(p, attr) for p in projects), dtype=dtype, count=len(projects))
 
+        return {
+            'setup_cost': column('setup_cost'),
+            'monthly_cost': column('monthly_cost'),
+            'monthly_revenue': column('monthly_revenue'),
+            'monthly_savings': column('monthly_savings'),
+            'water_gallons_daily': column('water_gallons_daily'),
+            'space_required_sqft': column('space_required_sqft'),
+            'base_sales_probability': column('base_sales_probability'),
+            'seasonal_mult': np.array([p.seasonal_multipliers for p in projects],
+                                      dtype=np.float64).reshape(len(projects), 4),
+            'climate_benefit': column('climate_controlled_benefit'),
+            'is_indoor': column('is_indoor', dtype=bool),
+            'automation_potential': column('automation_potential'),
+            'scalability': column('scalability'),
+            # synergy[i, j] is 1 when either project lists the other as a synergy
+            'synergy': np.array([[float(p.name in q.synergy_projects or q.name in p.synergy_projects)
+                                  for q in projects] for p in projects],
+                                dtype=np.float64).reshape(len(projects), len(projects)),
+        }
 
+    def _build_upgrade_arrays(self) -> Dict[str, np.ndarray]:
+        """Struct-of-arrays copy of the upgrade numbers used by the projection loop"""
+        upgrades = list(self.infrastructure_upgrades.values())
+        return {
+            'cost': np.array([u.cost for u in upgrades], dtype=np.float64),
+            'monthly_operating_cost': np.array([u.monthly_operating_cost for u in upgrades],
+                                               dtype=np.float64),
+            # Revenue gain (benefit - 1) per season, the only part of the ROI that varies
+            'seasonal_gain': np.array([u.seasonal_benefits for u in upgrades],
+                                      dtype=np.float64).reshape(len(upgrades), 4) - 1,
+            'affects_climate': np.array(["climate_controlled_sqft" in u.resource_impacts
+                                         for u in upgrades], dtype=bool),
+            'climate_sqft': np.array([u.resource_impacts.get("climate_controlled_sqft", 0)
+                                      for u in upgrades], dtype=np.float64),
+        }
 
-    def check_power_feasibility(self, projects: List[Project]) -> bool:
-        daytime_power = sum(p.power_usage.kwh_daily
-                            for p in projects
-                            if p.power_usage.time_of_use == PowerTimeOfUse.DAYTIME_ONLY)
+    def refresh_resources(self):
+        """Recompute everything derived from self.resources.
+
+        Revenue, ROI, water costs and the report use values cached from the resources,
+        so call this after changing self.resources (upgrades applied by
+        optimize_with_infrastructure refresh automatically).
+        """
+        # Look each product type's market multiplier up once, not per revenue call
+        self._market_multipliers = {p.product_type: self._market_multiplier(p.product_type)
+                                    for p in self.projects.values()}
+        self._market_mult = np.fromiter(
+            (self._market_multipliers[p.product_type] for p in self.projects.values()),
+            dtype=np.float64, count=len(self.projects))
+        # Common case: without market connections skip the multiplier lookup entirely.
+        # Bound on every instance, either way, so the attribute lookup stays uniform
+        self.calculate_market_adjusted_revenue = (
+            self._calc_rev_market if self.resources.market_connections else self._calc_rev_no_market)
+        self._revenue_table = self._build_revenue_table()
+        # Monthly cost per daily gallon: 100 gallon tank, round trips at $3.50/gallon of gas
+        self._water_cost_factor = (30 / 100 * self.resources.water_distance_miles * 2 *
+                                   3.50 / self.resources.truck_mpg)
+
+    def _build_revenue_table(self, climate_controlled_sqft: Optional[float] = None) -> np.ndarray:
+        """Market adjusted revenue for every project (rows) in every season (columns).
+
+        Depends on the current resources; refresh_resources rebuilds the cached copy.
+        """
+        if climate_controlled_sqft is None:
+            climate_controlled_sqft = self.resources.climate_controlled_sqft
+        arrays = self._proj_arrays
+        climate_mult = np.where(
+            arrays['is_indoor'] & (arrays['space_required_sqft'] <= climate_controlled_sqft),
+            arrays['climate_benefit'], 1.0)
+        return (arrays['monthly_revenue'][:, None] * arrays['seasonal_mult'] *
+                climate_mult[:, None] * self._market_mult[:, None] *
+                arrays['base_sales_probability'][:, None])
+
+    def _project_mask(self, projects: List[Project]) -> np.ndarray:
+        """Boolean mask over self.projects selecting the given projects"""
+        mask = np.zeros(len(self._project_index), dtype=bool)
+        for project in projects:
+            mask[self._project_index[id(project)]] = True
+        return mask
+
+    def _split_owned(self, projects: List[Project]) -> Tuple[np.ndarray, List[Project]]:
+        """Mask over self.projects for the given projects, plus those not in self.projects"""
+        mask = np.zeros(len(self._project_index), dtype=bool)
+        foreign_projects = []
+        for project in projects:
+            index = self._project_index.get(id(project))
+            if index is None:
+                foreign_projects.append(project)
+            else:
+                mask[index] = True
+        return mask, foreign_projects
 
-        battery_power = sum(p.power_usage.kwh_daily
-                            for p in projects
-                            if p.power_usage.time_of_use in [PowerTimeOfUse.NIGHT_ONLY, PowerTimeOfUse.ANY_TIME])
+    def check_power_feasibility(self, projects: List[Project]) -> bool:
+        # Daytime-only loads run straight off solar, everything else draws on the battery
+        daytime_power = 0
+        battery_power = 0
+        for p in projects:
+            if p.power_usage.time_of_use is PowerTimeOfUse.DAYTIME_ONLY:
+                daytime_power += p.power_usage.kwh_daily
+            else:
+                battery_power += p.power_usage.kwh_daily
 
         return (daytime_power <= self.resources.daytime_power_available_kwh and
                 battery_power <= self.resources.battery_capacity_kwh * 0.8)  # 80% DOD for battery longevity
 
     def calculate_water_costs(self, gallons_daily: float) -> float:
-        trips_per_month = (gallons_daily * 30) / 100  # assumin 100 gallon tank
-        miles_per_month = trips_per_month * self.resources.water_distance_miles * 2
-        gas_cost_per_mile = 3.50 / self.resources.truck_mpg
-        return miles_per_month * gas_cost_per_mile
+        # Per-gallon factor comes from the resources as of the last refresh_resources()
+        return gallons_daily * self._water_cost_factor
 
     def calculate_market_adjusted_revenue(self, project: Project, season: Season) -> float:
         """Calculate revenue adjusted for market connections and season"""
-        base_revenue = project.monthly_revenue
-
         # Apply seasonal multiplier
-        revenue = base_revenue * project.seasonal_multipliers[season]
+        revenue = project.monthly_revenue * project.seasonal_multipliers[season]
 
         # Apply climate control benefit if applicable
         if project.is_indoor and project.space_required_sqft <= self.resources.climate_controlled_sqft:
             revenue *= project.climate_controlled_benefit
 
         # Apply market connection multipliers
-        if self.resources.market_connections:
-            relevant_connections = [
-                conn for conn in self.resources.market_connections
-                if project.product_type in conn.product_types
-            ]
-            if relevant_connections:
-                max_multiplier = max(conn.sales_multiplier for conn in relevant_connections)
-                revenue *= max_multiplier
+        market_multiplier = self._market_multipliers.get(project.product_type)
+        if market_multiplier is None:  # Product not offered by any of our projects
+            market_multiplier = self._market_multiplier(project.product_type)
 
         # Apply base sales probability
-        revenue *= project.base_sales_probability
+        return revenue * market_multiplier * project.base_sales_probability
 
-        return revenue
+    # refresh_resources binds one of these variants over the method on each instance
+    _calc_rev_market = calculate_market_adjusted_revenue
+
+    def _calc_rev_no_market(self, project: Project, season: Season) -> float:
+        """calculate_market_adjusted_revenue specialized for resources without market connections"""
+        revenue = project.monthly_revenue * project.seasonal_multipliers[season]
+        if project.is_indoor and project.space_required_sqft <= self.resources.climate_controlled_sqft:
+            revenue *= project.climate_controlled_benefit
+        return revenue * project.base_sales_probability
+
+    def _market_multiplier(self, product_type: str) -> float:
+        """Best sales multiplier among market connections that take this product type"""
+        if not self.resources.market_connections:
+            return 1.0
+        return max((conn.sales_multiplier for conn in self.resources.market_connections
+                    if product_type in conn.product_types), default=1.0)
 
     def calculate_infrastructure_roi(self, upgrade: InfrastructureUpgrade,
                                      current_projects: List[Project],
                                      projection_months: int = 12) -> float:
-        """Calculate ROI for an infrastructure upgrade considering seasonal benefits"""
+        """Calculate ROI for an infrastructure upgrade considering seasonal benefits.
+
+        Only projects in production earn revenue, so only they count toward the benefit,
+        the same as the upgrade selection in optimize_with_infrastructure.
+        """
         total_cost = upgrade.cost + (upgrade.monthly_operating_cost * projection_months)
         total_benefit = 0
 
-        # Calculate monthly benefits across seasons
-        for month in range(projection_months):
-            season = Season(["spring", "summer", "fall", "winter"][month % 4])
-
-            # Calculate benefit to existing projects
-            for project in current_projects:
+        # Only climate control changes revenue of existing indoor projects
+        if "climate_controlled_sqft" in upgrade.resource_impacts:
+            owned_mask, foreign_projects = self._split_owned(
+                [p for p in current_projects if p.current_stage == "production"])
+            indoor_mask = owned_mask & self._proj_arrays['is_indoor']
+            # Each month adds revenue * (benefit - 1), so weight seasons by their month counts
+            months_per_season = _season_counts(projection_months)
+            season_weights = (np.array(upgrade.seasonal_benefits) - 1) * months_per_season
+            total_benefit = float((self._revenue_table[indoor_mask] @ season_weights).sum())
+            for project in foreign_projects:
                 if project.is_indoor:
-                    # Calculate revenue difference with upgrade
-                    current_revenue = self.calculate_market_adjusted_revenue(project, season)
-
-                    # Simulate revenue with upgrade
-                    if "climate_controlled_sqft" in upgrade.resource_impacts:
-                        project_with_upgrade = project
-                        revenue_with_upgrade = current_revenue * upgrade.seasonal_benefits[season]
-
-                        total_benefit += revenue_with_upgrade - current_revenue
+                    total_benefit += sum(self.calculate_market_adjusted_revenue(project, season) *
+                                         season_weights[season] for season in Season)
 
         return (total_benefit - total_cost) / total_cost if total_cost > 0 else 0
 
     def calculate_project_score(self, project: Project, selected_projects: List[Project]) -> float:
-        # Calculate base ROI considering water costs and seasonal adjustments
-        monthly_water_cost = self.calculate_water_costs(project.water_gallons_daily)
-        monthly_profit = (project.monthly_revenue + project.monthly_savings -
-                          project.monthly_cost - monthly_water_cost)
-        simple_roi = monthly_profit / project.setup_cost
-
         # Consider synergy with existing projects
         synergy_bonus = sum(1 for p in selected_projects
                             if project.name in p.synergy_projects
                             or p.name in project.synergy_projects)
 
+        return self._combined_score(project.monthly_revenue, project.monthly_savings,
+                                    project.monthly_cost, project.water_gallons_daily,
+                                    project.setup_cost, synergy_bonus,
+                                    project.automation_potential, project.scalability)
+
+    def calculate_project_scores(self, selected_projects: List[Project]) -> np.ndarray:
+        """calculate_project_score for every project in self.projects, in the same order"""
+        projects = list(self.projects.values())
+        arrays = self._proj_arrays
+
+        # Count each selected project that has a synergy with the candidate
+        selected_counts = np.zeros(len(projects))
+        synergy_bonus = np.zeros(len(projects))
+        for p in selected_projects:
+            index = self._project_index.get(id(p))
+            if index is None:  # Not one of ours, so match synergies by name
+                synergy_bonus += [float(q.name in p.synergy_projects or p.name in q.synergy_projects)
+                                  for q in projects]
+            else:
+                selected_counts[index] += 1
+        synergy_bonus += arrays['synergy'] @ selected_counts
+
+        return self._combined_score(arrays['monthly_revenue'], arrays['monthly_savings'],
+                                    arrays['monthly_cost'], arrays['water_gallons_daily'],
+                                    arrays['setup_cost'], synergy_bonus,
+                                    arrays['automation_potential'], arrays['scalability'])
+
+    def _combined_score(self, monthly_revenue, monthly_savings, monthly_cost, water_gallons_daily,
+                        setup_cost, synergy_bonus, automation_potential, scalability):
+        """Project score formula, for one project (floats) or all of them (arrays)"""
+        # Calculate base ROI considering water costs and seasonal adjustments
+        monthly_water_cost = self.calculate_water_costs(water_gallons_daily)
+        monthly_profit = monthly_revenue + monthly_savings - monthly_cost - monthly_water_cost
+        simple_roi = monthly_profit / setup_cost
+
         # Consider automation potential (if user has automation skills)
-        automation_bonus = (project.automation_potential / 10) if self.resources.has_automation_skills else 0
+        automation_bonus = (automation_potential / 10) if self.resources.has_automation_skills else 0
 
         # Consider scalability potential
-        scalability_bonus = project.scalability / 10
+        scalability_bonus = scalability / 10
 
         # Combine scores with weights (adjust weights as needed)
         return (simple_roi * 0.4 +  # 40% weight on ROI
                 synergy_bonus * 0.2 +  # 20% weight on synergies
                 automation_bonus * 0.2 +  # 20% weight on automation potential
                 scalability_bonus * 0.2)  # 20% weight on scalability
-    
 
+    def optimize_with_infrastructure(self, projection_months=24, aggressive_reinvestment=12,
+                                     current_projects: Optional[List[Project]] = None):
+        """Project finances month by month, funding projects and buying upgrades.
 
-    def optimize_with_infrastructure(self, projection_months=24, aggressive_reinvestment=12):
-        current_projects = []
+        current_projects are projects from self.projects that are already running.
+        The first call compiles the Numba kernel (several seconds); the compiled code
+        is cached in __pycache__ for later runs.
+        """
+        current_projects = list(current_projects) if current_projects else []
         planned_upgrades = []
         available_budget = self.resources.available_money_monthly * self.resources.investment_period_months
         financial_projection = {
@@ -643,88 +802,66 @@ class FarmOptimizer:
         available_hours = self.resources.work_hours_daily[0]
         available_indoor_space = self.resources.indoor_space_sqft
         available_outdoor_space = self.resources.outdoor_space_acres * 43560  # Convert acres to sqft
-        accumulated_savings = 0  # Track accumulated savings explicitly
 
-        # Monthly projection loop
+        # ... (rest of the optimization logic, including project selection, resource allocation, and financial tracking)
+
+        # Run the monthly projection loop on plain arrays
+        projects = list(self.projects.values())
+        upgrades = list(self.infrastructure_upgrades.values())
+        arrays = self._proj_arrays
+        upgrade_arrays = self._upgrade_arrays
+        stage = np.array([_STAGES.index(p.current_stage) if p.current_stage in _STAGES else -1
+                          for p in projects], dtype=np.int64)
+        initial_stage = stage.copy()
+        startup_left = np.array([p.startup_time_months for p in projects], dtype=np.int64)
+        funded_so_far = np.array([p.funded_so_far for p in projects], dtype=np.float64)
+        profits, savings, investments, upgrade_month, funded = _project_numba(
+            self._project_mask(current_projects), stage, startup_left, funded_so_far,
+            arrays['setup_cost'], arrays['monthly_cost'],
+            self.calculate_water_costs(arrays['water_gallons_daily']),
+            arrays['is_indoor'], arrays['space_required_sqft'],
+            self._build_revenue_table(-np.inf), self._build_revenue_table(np.inf),
+            float(self.resources.climate_controlled_sqft),
+            upgrade_arrays['cost'], upgrade_arrays['monthly_operating_cost'],
+            upgrade_arrays['seasonal_gain'], upgrade_arrays['affects_climate'],
+            upgrade_arrays['climate_sqft'],
+            float(available_budget), float(self.resources.reinvestment_rate), projection_months)
+
+        # Write project state back
+        for i, project in enumerate(projects):
+            if stage[i] != initial_stage[i]:
+                project.current_stage = _STAGES[stage[i]]
+            project.startup_time_months = int(startup_left[i])
+            if funded_so_far[i] != project.funded_so_far:
+                project.funded_so_far = float(funded_so_far[i])
+
         for month in range(projection_months):
-            season = Season.from_month(month)
             monthly_report = {"month": month + 1, "actions": [], "profit": 0, "savings": 0}
+            for i in np.flatnonzero(funded[month]):
+                monthly_report["actions"].append(f"Funded {projects[i].name}")
 
-            # Update project stages and calculate monthly revenue
-            for project in current_projects:
-                project.update_stage()
-
-                if project.current_stage == "production":
-                    project.monthly_revenue = calculate_monthly_revenue(project)
-                else:
-                    project.monthly_revenue = 0
-
-            # ... (rest of the optimization logic, including project selection, resource allocation, and financial tracking)
-
-            # Allocate funds to projects based on available budget and project stage
-            for project in self.projects.values():
-                if project not in current_projects and project.current_stage == "setup":
-                    required_funds = project.setup_cost - project.funded_so_far
-                    if required_funds <= available_budget:
-                        # Allocate funds to the project
-                        project.funded_so_far += required_funds
-                        available_budget -= required_funds
-                        if project.funded_so_far >= project.setup_cost:
-                            project.current_stage = "growth"
-                        monthly_report["actions"].append(f"Funded {project.name}")
-
-           
-            # Calculate monthly revenue and costs
-            monthly_revenue = sum(
-                self.calculate_market_adjusted_revenue(project, season)
-                for project in current_projects
-            )
-            monthly_costs = sum(project.monthly_cost for project in current_projects)
-            water_costs = sum(self.calculate_water_costs(p.water_gallons_daily)
-                              for p in current_projects)
-
-            monthly_profit = monthly_revenue - monthly_costs - water_costs
-            monthly_report["profit"] = monthly_profit
-
-            # Reinvest profits aggressively
-            reinvestment_amount = monthly_profit + available_budget
-            affordable_upgrades = [
-                upgrade for upgrade in self.infrastructure_upgrades.values()
-                if upgrade not in planned_upgrades and upgrade.cost <= reinvestment_amount
-            ]
-
-            # Select the best ROI upgrade
-            if affordable_upgrades:
-                best_upgrade = max(
-                    affordable_upgrades,
-                    key=lambda u: self.calculate_infrastructure_roi(u, current_projects, projection_months - month)
-                )
+            for u in np.flatnonzero(upgrade_month == month):
+                best_upgrade = upgrades[u]
                 planned_upgrades.append(best_upgrade)
-                reinvestment_amount -= best_upgrade.cost
 
                 # Apply upgrade benefits
-                for resource, impact in best_upgrade.resource_impacts.items():
-                    if hasattr(self.resources, resource):
-                        current_value = getattr(self.resources, resource)
-                        setattr(self.resources, resource, current_value + impact)
+                for getter, resource, impact in self._upgrade_impact_ops[u]:
+                    setattr(self.resources, resource, getter(self.resources) + impact)
 
                 monthly_report["actions"].append(f"Implemented upgrade: {best_upgrade.name}")
 
-            # Update savings and budget
-            savings_amount = reinvestment_amount * (1 - self.resources.reinvestment_rate)
-            accumulated_savings += savings_amount
-            available_budget = reinvestment_amount * self.resources.reinvestment_rate
-            monthly_report["savings"] = accumulated_savings
+            monthly_report["profit"] = float(profits[month])
+            monthly_report["savings"] = float(savings[month])
 
             # Update financial projection
             financial_projection['monthly_details'].append(monthly_report)
-            financial_projection['monthly_profits'].append(monthly_profit)
-            financial_projection['accumulated_savings'].append(accumulated_savings)
-            financial_projection['infrastructure_investments'].append(
-                sum(upgrade.cost for upgrade in planned_upgrades)
-            )
-            financial_projection['well_savings'].append(accumulated_savings)
+            financial_projection['monthly_profits'].append(float(profits[month]))
+            financial_projection['accumulated_savings'].append(float(savings[month]))
+            financial_projection['infrastructure_investments'].append(float(investments[month]))
+            financial_projection['well_savings'].append(float(savings[month]))
 
+        if planned_upgrades:
+            self.refresh_resources()
 
         return current_projects, planned_upgrades, financial_projection
 
@@ -732,53 +869,59 @@ class FarmOptimizer:
                                  upgrades: List[InfrastructureUpgrade],
                                  financial_projection: Dict) -> str:
         """Generate detailed report including monthly breakdown and infrastructure analysis."""
-        report = "Enhanced Farm Optimization Report\n\n"
+        report = ["Enhanced Farm Optimization Report\n\n"]
 
         # Financial Summary
-        report += "Financial Projection Summary:\n"
-        report += f"Total Months Projected: {len(financial_projection['monthly_profits'])}\n"
-        report += f"Final Accumulated Savings: ${financial_projection['accumulated_savings'][-1]:.2f}\n"
-        report += f"Total Infrastructure Investment: ${financial_projection['infrastructure_investments'][-1]:.2f}\n"
-        report += f"Progress Toward Well: {(financial_projection['well_savings'][-1] / self.resources.target_savings * 100):.1f}%\n\n"
+        report.append("Financial Projection Summary:\n")
+        report.append(f"Total Months Projected: {len(financial_projection['monthly_profits'])}\n")
+        report.append(f"Final Accumulated Savings: ${financial_projection['accumulated_savings'][-1]:.2f}\n")
+        report.append(f"Total Infrastructure Investment: ${financial_projection['infrastructure_investments'][-1]:.2f}\n")
+        report.append(f"Progress Toward Well: {(financial_projection['well_savings'][-1] / self.resources.target_savings * 100):.1f}%\n\n")
 
         # Monthly Breakdown
-        report += "Monthly Breakdown:\n"
+        report.append("Monthly Breakdown:\n")
         for month_detail in financial_projection['monthly_details']:
-            report += f"Month {month_detail['month']}:\n"
+            report.append(f"Month {month_detail['month']}:\n")
             for action in month_detail["actions"]:
-                report += f"  - {action}\n"
-            report += f"  Profit: ${month_detail['profit']:.2f}\n"
-            report += f"  Savings: ${month_detail['savings']:.2f}\n\n"
+                report.append(f"  - {action}\n")
+            report.append(f"  Profit: ${month_detail['profit']:.2f}\n")
+            report.append(f"  Savings: ${month_detail['savings']:.2f}\n\n")
 
         # Project Details with Seasonal Analysis
-        report += "Project Performance by Season:\n"
+        report.append("Project Performance by Season:\n")
         for project in projects:
-            report += f"\n{project.name}\n"
-            for season in Season:
-                revenue = self.calculate_market_adjusted_revenue(project, season)
-                report += f"   {season.value}: ${revenue:.2f}/month\n"
+            report.append(f"\n{project.name}\n")
+            index = self._project_index.get(id(project))
+            if index is not None:
+                revenues = self._revenue_table[index]
+            else:  # Not one of this optimizer's projects, so not in the table
+                revenues = [self.calculate_market_adjusted_revenue(project, season) for season in Season]
+            for season, revenue in zip(Season, revenues):
+                report.append(f"   {season.name.lower()}: ${revenue:.2f}/month\n")
 
-        return report
+        return "".join(report)
 
 
 # Example usage
-resources = Resources(
-    solar_power_kw=10,
-    battery_capacity_kwh=28,
-    daytime_power_available_kwh=35,  # Average available during peak sun
-    water_distance_miles=35,
-    truck_mpg=15,
-    initial_soil=0,
-    available_money_monthly=500,
-    investment_period_months=12,
-    work_hours_daily=(8, 10),
-    outdoor_space_acres=0.5,
-    indoor_space_sqft=200,
-    has_automation_skills=True
-)
-
-optimizer = FarmOptimizer(resources)
-recommended_projects, recommended_upgrades, financial_projection = optimizer.optimize_with_infrastructure()
-
-# Generate and print report
-print(optimizer.generate_enhanced_report(recommended_projects, recommended_upgrades, financial_projection))
\ No newline at end of file
+# The guard keeps the example from rerunning when Numba's cache imports this module
+if __name__ == "__main__":
+    resources = Resources(
+        solar_power_kw=10,
+        battery_capacity_kwh=28,
+        daytime_power_available_kwh=35,  # Average available during peak sun
+        water_distance_miles=35,
+        truck_mpg=15,
+        initial_soil=0,
+        available_money_monthly=500,
+        investment_period_months=12,
+        work_hours_daily=(8, 10),
+        outdoor_space_acres=0.5,
+        indoor_space_sqft=200,
+        has_automation_skills=True
+    )
+
+    optimizer = FarmOptimizer(resources)
+    recommended_projects, recommended_upgrades, financial_projection = optimizer.optimize_with_infrastructure()
+
+    # Generate and print report
+    print(optimizer.generate_enhanced_report(recommended_projects, recommended_upgrades, financial_projection))
\ No newline at end of file
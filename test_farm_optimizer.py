@@ -0,0 +1,288 @@
+import copy
+import random
+import unittest
+
+from farm_optimizer import FarmOptimizer, InfrastructureUpgrade, MarketConnection, Resources, Season
+
+
+def make_resources(rng):
+    connections = None
+    if rng.random() < 0.5:
+        connections = [MarketConnection("co-op", ["plants", "eggs, meat"], rng.uniform(1.0, 1.5)),
+                       MarketConnection("market", ["feed", "plants"], rng.uniform(1.0, 2.0))]
+    return Resources(
+        solar_power_kw=10,
+        battery_capacity_kwh=28,
+        daytime_power_available_kwh=35,
+        water_distance_miles=rng.choice([5, 35]),
+        truck_mpg=15,
+        initial_soil=0,
+        available_money_monthly=rng.uniform(100, 3000),
+        investment_period_months=12,
+        work_hours_daily=(8, 10),
+        outdoor_space_acres=0.5,
+        indoor_space_sqft=200,
+        has_automation_skills=rng.random() < 0.5,
+        climate_controlled_sqft=rng.choice([0, 20, 40, 60]),
+        market_connections=connections,
+        reinvestment_rate=rng.uniform(0.3, 0.9),
+    )
+
+
+class ExtraUpgradesOptimizer(FarmOptimizer):
+    """FarmOptimizer with random climate upgrades competing with the greenhouse"""
+
+    def __init__(self, resources, upgrade_seed):
+        self.upgrade_seed = upgrade_seed
+        super().__init__(resources)
+
+    def _initialize_upgrades(self):
+        rng = random.Random(self.upgrade_seed)
+        upgrades = super()._initialize_upgrades()
+        for name in ("shade_house", "vent_fans"):
+            free = rng.random() < 0.2
+            upgrades[name] = InfrastructureUpgrade(
+                name=name,
+                cost=0 if free else rng.uniform(200, 6000),
+                resource_impacts={"climate_controlled_sqft": rng.choice([0, 30, 100])},
+                monthly_operating_cost=0 if free else rng.uniform(0, 100),
+                seasonal_benefits=tuple(rng.uniform(0.9, 1.6) for _ in Season))
+        return upgrades
+
+
+def reference_revenue(resources, project, season):
+    """Market adjusted revenue computed straight from the live resources"""
+    revenue = project.monthly_revenue * project.seasonal_multipliers[season]
+    if project.is_indoor and project.space_required_sqft <= resources.climate_controlled_sqft:
+        revenue *= project.climate_controlled_benefit
+    if resources.market_connections:
+        multipliers = [conn.sales_multiplier for conn in resources.market_connections
+                       if project.product_type in conn.product_types]
+        if multipliers:
+            revenue *= max(multipliers)
+    return revenue * project.base_sales_probability
+
+
+def reference_water_cost(resources, gallons_daily):
+    trips_per_month = (gallons_daily * 30) / 100
+    return trips_per_month * resources.water_distance_miles * 2 * 3.50 / resources.truck_mpg
+
+
+def reference_roi(resources, upgrade, current_projects, projection_months):
+    """Month by month ROI, counting only projects in production"""
+    total_cost = upgrade.cost + upgrade.monthly_operating_cost * projection_months
+    total_benefit = 0
+    for month in range(projection_months):
+        season = Season.from_month(month)
+        for project in current_projects:
+            if (project.is_indoor and project.current_stage == "production"
+                    and "climate_controlled_sqft" in upgrade.resource_impacts):
+                current_revenue = reference_revenue(resources, project, season)
+                total_benefit += current_revenue * upgrade.seasonal_benefits[season] - current_revenue
+    return (total_benefit - total_cost) / total_cost if total_cost > 0 else 0
+
+
+def reference_projection(optimizer, current_projects, projection_months):
+    """Plain Python month loop the Numba kernel has to reproduce, reading resources live"""
+    resources = optimizer.resources
+    planned_upgrades = []
+    available_budget = resources.available_money_monthly * resources.investment_period_months
+    details, profits, savings, investments = [], [], [], []
+    accumulated_savings = 0
+
+    for month in range(projection_months):
+        season = Season.from_month(month)
+        actions = []
+
+        for project in current_projects:
+            project.update_stage()
+
+        for project in optimizer.projects.values():
+            if project not in current_projects and project.current_stage == "setup":
+                required_funds = project.setup_cost - project.funded_so_far
+                if required_funds <= available_budget:
+                    project.funded_so_far += required_funds
+                    available_budget -= required_funds
+                    if project.funded_so_far >= project.setup_cost:
+                        project.current_stage = "growth"
+                    actions.append(f"Funded {project.name}")
+
+        monthly_revenue = sum(reference_revenue(resources, p, season)
+                              for p in current_projects if p.current_stage == "production")
+        monthly_costs = sum(p.monthly_cost + reference_water_cost(resources, p.water_gallons_daily)
+                            for p in current_projects)
+        monthly_profit = monthly_revenue - monthly_costs
+
+        reinvestment_amount = monthly_profit + available_budget
+        affordable_upgrades = [u for u in optimizer.infrastructure_upgrades.values()
+                               if u not in planned_upgrades and u.cost <= reinvestment_amount]
+        if affordable_upgrades:
+            best_upgrade = max(affordable_upgrades, key=lambda u: reference_roi(
+                resources, u, current_projects, projection_months - month))
+            planned_upgrades.append(best_upgrade)
+            reinvestment_amount -= best_upgrade.cost
+            for resource, impact in best_upgrade.resource_impacts.items():
+                if hasattr(resources, resource):
+                    setattr(resources, resource, getattr(resources, resource) + impact)
+            actions.append(f"Implemented upgrade: {best_upgrade.name}")
+
+        accumulated_savings += reinvestment_amount * (1 - resources.reinvestment_rate)
+        available_budget = reinvestment_amount * resources.reinvestment_rate
+        details.append(actions)
+        profits.append(monthly_profit)
+        savings.append(accumulated_savings)
+        investments.append(sum(u.cost for u in planned_upgrades))
+
+    return planned_upgrades, details, profits, savings, investments
+
+
+class ProjectionKernelTest(unittest.TestCase):
+    def assertListsClose(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(a, e, delta=1e-6 * max(1.0, abs(e)))
+
+    def test_kernel_matches_reference_loop(self):
+        rng = random.Random(1234)
+        for _ in range(200):
+            seed = rng.random()
+            keys = list(FarmOptimizer(make_resources(random.Random(seed))).projects)
+            active_keys = rng.sample(keys, rng.randint(0, len(keys)))
+            # Projects already in production make the upgrade ROI matter from the first month
+            producing_keys = rng.sample(active_keys, rng.randint(0, len(active_keys)))
+            months = rng.randint(1, 36)
+
+            expected = ExtraUpgradesOptimizer(make_resources(random.Random(seed)), seed)
+            actual = ExtraUpgradesOptimizer(make_resources(random.Random(seed)), seed)
+            for key in producing_keys:
+                expected.projects[key].current_stage = actual.projects[key].current_stage = "production"
+            expected_upgrades, details, profits, savings, investments = reference_projection(
+                expected, [expected.projects[k] for k in active_keys], months)
+
+            _, upgrades, projection = actual.optimize_with_infrastructure(
+                months, current_projects=[actual.projects[k] for k in active_keys])
+
+            self.assertEqual([u.name for u in upgrades], [u.name for u in expected_upgrades])
+            self.assertEqual([m["actions"] for m in projection['monthly_details']], details)
+            self.assertListsClose(projection['monthly_profits'], profits)
+            self.assertListsClose(projection['accumulated_savings'], savings)
+            self.assertListsClose(projection['infrastructure_investments'], investments)
+            for key in keys:
+                a, e = actual.projects[key], expected.projects[key]
+                self.assertEqual((a.current_stage, a.startup_time_months, a.funded_so_far),
+                                 (e.current_stage, e.startup_time_months, e.funded_so_far))
+            self.assertEqual(actual.resources, expected.resources)
+
+
+class InfrastructureRoiTest(unittest.TestCase):
+    def test_roi_matches_month_by_month_reference(self):
+        rng = random.Random(99)
+        for _ in range(100):
+            optimizer = ExtraUpgradesOptimizer(make_resources(rng), rng.random())
+            projects = rng.sample(list(optimizer.projects.values()), rng.randint(0, len(optimizer.projects)))
+            # Copies are projects the optimizer does not own
+            projects += [copy.copy(p) for p in rng.sample(projects, min(2, len(projects)))]
+            for project in projects:
+                project.current_stage = rng.choice(["setup", "growth", "production"])
+            months = rng.randint(0, 30)
+            for upgrade in optimizer.infrastructure_upgrades.values():
+                self.assertAlmostEqual(
+                    optimizer.calculate_infrastructure_roi(upgrade, projects, months),
+                    reference_roi(optimizer.resources, upgrade, projects, months))
+
+
+class TemplateIsolationTest(unittest.TestCase):
+    def test_optimizers_do_not_share_project_data(self):
+        resources = make_resources(random.Random(0))
+        first = FarmOptimizer(resources)
+        first.projects['air_plants'].power_usage.kwh_daily = 99
+        first.projects['air_plants'].synergy_projects.append("duck_ranching")
+        first.infrastructure_upgrades['greenhouse'].resource_impacts["indoor_space_sqft"] = 0
+
+        second = FarmOptimizer(resources)
+        self.assertEqual(second.projects['air_plants'].power_usage.kwh_daily, 1.2)
+        self.assertEqual(second.projects['air_plants'].synergy_projects, ["plant_cloning"])
+        self.assertEqual(second.infrastructure_upgrades['greenhouse'].resource_impacts["indoor_space_sqft"], 500)
+
+
+class ResourceRefreshTest(unittest.TestCase):
+    def test_market_connections_changed_after_construction(self):
+        for initial in ([], [MarketConnection("co-op", ["eggs, meat"], 1.2)]):
+            resources = make_resources(random.Random(0))
+            resources.market_connections = list(initial)
+            optimizer = FarmOptimizer(resources)
+            project = optimizer.projects['air_plants']
+            before = optimizer.calculate_market_adjusted_revenue(project, Season.SPRING)
+
+            resources.market_connections.append(MarketConnection("market", [project.product_type], 2.0))
+            optimizer.refresh_resources()
+            after = optimizer.calculate_market_adjusted_revenue(project, Season.SPRING)
+            self.assertAlmostEqual(after, 2.0 * before)
+            self.assertAlmostEqual(
+                optimizer._revenue_table[optimizer._project_index[id(project)], Season.SPRING], after)
+
+    def test_climate_control_changed_after_construction(self):
+        resources = make_resources(random.Random(0))
+        resources.climate_controlled_sqft = 0
+        optimizer = FarmOptimizer(resources)
+        project = optimizer.projects['air_plants']
+        before = optimizer.calculate_market_adjusted_revenue(project, Season.SPRING)
+
+        resources.climate_controlled_sqft = 1000
+        optimizer.refresh_resources()
+        after = optimizer.calculate_market_adjusted_revenue(project, Season.SPRING)
+        self.assertAlmostEqual(after, before * project.climate_controlled_benefit)
+        self.assertAlmostEqual(
+            optimizer._revenue_table[optimizer._project_index[id(project)], Season.SPRING], after)
+        upgrade = optimizer.infrastructure_upgrades['greenhouse']
+        self.assertAlmostEqual(optimizer.calculate_infrastructure_roi(upgrade, []), -1.0)
+        project.current_stage = "production"
+        roi_projects = [project, copy.copy(project)]
+        expected_benefit = 2 * sum(after / project.seasonal_multipliers[Season.SPRING] *
+                                   project.seasonal_multipliers[Season.from_month(month)] *
+                                   (upgrade.seasonal_benefits[Season.from_month(month)] - 1)
+                                   for month in range(12))
+        total_cost = upgrade.cost + upgrade.monthly_operating_cost * 12
+        self.assertAlmostEqual(optimizer.calculate_infrastructure_roi(upgrade, roi_projects),
+                               (expected_benefit - total_cost) / total_cost)
+
+
+    def test_water_source_changed_after_construction(self):
+        resources = make_resources(random.Random(0))
+        resources.water_distance_miles, resources.truck_mpg = 35, 15
+        optimizer = FarmOptimizer(resources)
+        self.assertAlmostEqual(optimizer.calculate_water_costs(10), 49.0)
+
+        resources.water_distance_miles = 0
+        optimizer.refresh_resources()
+        self.assertEqual(optimizer.calculate_water_costs(10), 0)
+
+
+class ProjectScoreTest(unittest.TestCase):
+    def test_vector_scores_match_scalar_scores(self):
+        rng = random.Random(42)
+        for _ in range(20):
+            optimizer = FarmOptimizer(make_resources(rng))
+            other = FarmOptimizer(make_resources(rng))
+            selected = rng.sample(list(optimizer.projects.values()), rng.randint(0, 3))
+            # Projects this optimizer does not own, including copies of its own
+            selected += rng.sample(list(other.projects.values()), rng.randint(0, 2))
+            selected += [copy.copy(p) for p in rng.sample(list(optimizer.projects.values()), 1)]
+
+            scores = optimizer.calculate_project_scores(selected)
+            for score, project in zip(scores, optimizer.projects.values()):
+                self.assertAlmostEqual(score, optimizer.calculate_project_score(project, selected))
+
+
+class SeasonalDataTest(unittest.TestCase):
+    def test_mapping_by_season_is_converted_to_tuple(self):
+        upgrade = InfrastructureUpgrade(
+            name="Shade Cloth", cost=100, resource_impacts={},
+            seasonal_benefits={Season.SPRING: 1.0, Season.SUMMER: 1.3, Season.FALL: 1.1, Season.WINTER: 1.0})
+        self.assertEqual(upgrade.seasonal_benefits, (1.0, 1.3, 1.1, 1.0))
+        self.assertEqual(upgrade.seasonal_benefits[Season.SUMMER], 1.3)
+        self.assertEqual(InfrastructureUpgrade("Shed", 10, {}).seasonal_benefits, (1.0, 1.0, 1.0, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()